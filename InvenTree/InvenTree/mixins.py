@@ -1,6 +1,8 @@
 """Mixins for (API) views in the whole project."""
 
-from django.core.exceptions import FieldDoesNotExist
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 
 from rest_framework import generics, mixins, status
 from rest_framework.response import Response
@@ -167,6 +169,91 @@ class ListAPI(generics.ListAPIView):
     """View for list API."""
 
 
+class TreeListAPI(ListAPI):
+    """View for listing all nodes of an InvenTreeTree model, ready for rendering as a tree.
+
+    The serializer fields are read directly from the database via values(),
+    rather than constructing (and serializing) a model instance for each node.
+
+    The data for the entire tree is cached when no query parameters are supplied,
+    and is invalidated when any node in the tree is saved or deleted.
+    """
+
+    # Timeout (in seconds) for the cached tree data
+    tree_cache_timeout = 600
+
+    # Cache backends which are not shared between processes
+    PROCESS_LOCAL_CACHE_BACKENDS = [
+        'django.core.cache.backends.dummy.DummyCache',
+        'django.core.cache.backends.locmem.LocMemCache',
+    ]
+
+    def tree_cache_enabled(self):
+        """Return True if the tree data can be cached.
+
+        The cache is only used if it is shared between all server (and background worker) processes,
+        otherwise a change made in one process would not invalidate the data cached by another.
+        """
+        return settings.CACHES['default']['BACKEND'] not in self.PROCESS_LOCAL_CACHE_BACKENDS
+
+    def annotate_tree_queryset(self, queryset):
+        """Annotate any serializer fields which are not database columns (override if required)."""
+        return queryset
+
+    def get_tree_queryset(self, queryset):
+        """Return a values() queryset containing the serializer fields for each node.
+
+        The serializer class is not used to render the data, so every serializer field
+        must either be a database column, or be annotated via annotate_tree_queryset()
+
+        Raises:
+            ImproperlyConfigured: If a serializer field cannot be read from the database
+        """
+        serializer_class = self.get_serializer_class()
+        fields = serializer_class.Meta.fields
+
+        queryset = self.annotate_tree_queryset(queryset)
+
+        for field in fields:
+            if field == 'pk' or field in queryset.query.annotations:
+                continue
+
+            # Declared serializer fields (e.g. SerializerMethodField) are not rendered here
+            if field not in serializer_class._declared_fields:
+                try:
+                    if queryset.model._meta.get_field(field).concrete:
+                        continue
+                except FieldDoesNotExist:
+                    pass
+
+            raise ImproperlyConfigured(
+                f"Field '{field}' of {serializer_class.__name__} is not a database column - it must be annotated in {type(self).__name__}.annotate_tree_queryset()"
+            )
+
+        return queryset.values(*fields)
+
+    def list(self, request, *args, **kwargs):
+        """Return the tree data, from the cache if available."""
+        queryset = self.get_tree_queryset(self.filter_queryset(self.get_queryset()))
+
+        if request.query_params or not self.tree_cache_enabled():
+            page = self.paginate_queryset(queryset)
+
+            if page is not None:
+                return self.get_paginated_response(page)
+
+            return Response(list(queryset))
+
+        key = self.queryset.model.get_tree_cache_key()
+        data = cache.get(key)
+
+        if data is None:
+            data = list(queryset)
+            cache.set(key, data, timeout=self.tree_cache_timeout)
+
+        return Response(data)
+
+
 class ListCreateAPI(CleanMixin, generics.ListCreateAPIView):
     """View for list and create API."""
 
@@ -10,8 +10,9 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.urls import reverse
@@ -625,19 +626,25 @@ class InvenTreeTree(MPTTModel):
             self.__class__.objects.rebuild()
 
         # 4. Rebuild the path for any remaining lower nodes
-        nodes = self.__class__.objects.filter(pk__in=lower_nodes)
+        self.update_pathstrings(self.__class__.objects.filter(pk__in=lower_nodes))
 
-        nodes_to_update = []
+        self.clear_tree_cache()
 
-        for node in nodes:
-            new_path = node.construct_pathstring()
+    @classmethod
+    def get_tree_cache_key(cls):
+        """Return the cache key used to store the serialized tree data for this model."""
+        return f'tree_{cls._meta.label_lower}'
 
-            if new_path != node.pathstring:
-                node.pathstring = new_path
-                nodes_to_update.append(node)
+    @classmethod
+    def clear_tree_cache(cls):
+        """Remove the cached tree data for this model (e.g. when the tree structure changes).
 
-        if len(nodes_to_update) > 0:
-            self.__class__.objects.bulk_update(nodes_to_update, ['pathstring'])
+        The data is removed once the current transaction is committed,
+        so that a concurrent request cannot re-cache the uncommitted tree.
+        """
+        key = cls.get_tree_cache_key()
+
+        transaction.on_commit(lambda: cache.delete(key))
 
     def handle_tree_delete(self, delete_children=False, delete_items=False):
         """Delete a single instance of the tree, based on provided kwargs.
@@ -742,6 +749,82 @@ class InvenTreeTree(MPTTModel):
             [item.name for item in self.path]
         )
 
+    def update_pathstrings(self, nodes, chunk_size=1000):
+        """Update the 'pathstring' field for a set of nodes.
+
+        Calling construct_pathstring() for each node requires a separate database query
+        (to fetch the ancestors of that node), so instead the (pk, parent, name) values
+        for the provided nodes (and any ancestors of those nodes) are fetched in bulk,
+        and the path for each node is then constructed in memory.
+
+        The nodes themselves are streamed from the database in chunks,
+        and any changed nodes are written back in batches of the same size.
+
+        Arguments:
+            nodes: A queryset of nodes to update
+            chunk_size: Number of nodes to fetch (and update) at a time
+        """
+        # Map each node in the provided set to its (parent, name) values
+        tree = {
+            pk: (parent, name) for pk, parent, name in nodes.values_list('pk', 'parent', 'name')
+        }
+
+        if len(tree) == 0:
+            return
+
+        # Parent nodes which are not in the provided set (e.g. the node which was just saved)
+        missing = set(parent for parent, _name in tree.values() if parent is not None and parent not in tree)
+
+        if len(missing) > 0:
+            # Fetch the missing parent nodes, and all of their ancestors
+            ancestors = models.Q()
+
+            for tree_id, lft, rght in self.__class__.objects.filter(pk__in=missing).values_list('tree_id', 'lft', 'rght'):
+                ancestors |= models.Q(tree_id=tree_id, lft__lte=lft, rght__gte=rght)
+
+            tree.update({
+                pk: (parent, name) for pk, parent, name in self.__class__.objects.filter(
+                    ancestors
+                ).values_list('pk', 'parent', 'name')
+            })
+
+        # Cache of node path names, from the top level down to each node
+        paths = {None: []}
+
+        def get_path(pk):
+            # Walk up the tree until we find a node with a known path
+            chain = []
+
+            while pk not in paths:
+                chain.append(pk)
+                pk = tree[pk][0]
+
+            path = paths[pk]
+
+            # Walk back down the tree, caching the path for each node along the way
+            for node_pk in reversed(chain):
+                path = path + [tree[node_pk][1]]
+                paths[node_pk] = path
+
+            return path
+
+        nodes_to_update = []
+
+        for node in nodes.iterator(chunk_size=chunk_size):
+            new_path = InvenTree.helpers.constructPathString(get_path(node.pk))
+
+            if new_path != node.pathstring:
+                node.pathstring = new_path
+                nodes_to_update.append(node)
+
+            # Write changes in batches, rather than keeping every changed node in memory
+            if len(nodes_to_update) >= chunk_size:
+                self.__class__.objects.bulk_update(nodes_to_update, ['pathstring'])
+                nodes_to_update = []
+
+        if len(nodes_to_update) > 0:
+            self.__class__.objects.bulk_update(nodes_to_update, ['pathstring'])
+
     def save(self, *args, **kwargs):
         """Custom save method for InvenTreeTree abstract model"""
         try:
@@ -766,19 +849,9 @@ class InvenTreeTree(MPTTModel):
             super().save(*args, **kwargs)
 
             # Update the pathstring for any child nodes
-            lower_nodes = self.get_descendants(include_self=False)
-
-            nodes_to_update = []
-
-            for node in lower_nodes:
-                new_path = node.construct_pathstring()
+            self.update_pathstrings(self.get_descendants(include_self=False))
 
-                if new_path != node.pathstring:
-                    node.pathstring = new_path
-                    nodes_to_update.append(node)
-
-            if len(nodes_to_update) > 0:
-                self.__class__.objects.bulk_update(nodes_to_update, ['pathstring'])
+        self.clear_tree_cache()
 
     name = models.CharField(
         blank=False,
@@ -10,26 +10,32 @@ from django.template.loaders.cached import Loader as CachedLoader
 class InvenTreeTemplateLoader(CachedLoader):
     """Custom template loader which bypasses cache for PDF export"""
 
-    def get_template(self, template_name, skip=None):
-        """Return a template object for the given template name.
+    def __init__(self, engine, loaders):
+        """Initialize the template loader.
 
-        Any custom report or label templates will be forced to reload (without cache).
-        This ensures that generated PDF reports / labels are always up-to-date.
+        The list of template paths which bypass the cache is constructed once here,
+        rather than for every template lookup.
         """
+        super().__init__(engine, loaders)
+
         # List of template patterns to skip cache for
-        skip_cache_dirs = [
+        self.skip_cache_dirs = [
             os.path.abspath(os.path.join(settings.MEDIA_ROOT, 'report')),
             os.path.abspath(os.path.join(settings.MEDIA_ROOT, 'label')),
             'snippets/',
         ]
 
-        # Initially load the template using the cached loader
-        template = CachedLoader.get_template(self, template_name, skip)
+    def get_template(self, template_name, skip=None):
+        """Return a template object for the given template name.
 
-        template_path = str(template.name)
+        Any custom report or label templates will be forced to reload (without cache).
+        This ensures that generated PDF reports / labels are always up-to-date.
+        """
+        template_path = str(template_name)
 
-        # If the template matches any of the skip patterns, reload it without cache
-        if any(template_path.startswith(d) for d in skip_cache_dirs):
-            template = BaseLoader.get_template(self, template_name, skip)
+        # If the template matches any of the skip patterns, load it without cache
+        # (these templates are not compiled into the cache first and then discarded)
+        if any(template_path.startswith(d) for d in self.skip_cache_dirs):
+            return BaseLoader.get_template(self, template_name, skip)
 
-        return template
+        return CachedLoader.get_template(self, template_name, skip)
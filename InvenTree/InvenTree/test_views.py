@@ -130,3 +130,69 @@ class ViewTests(InvenTreeTestCase):
         response = self.client.get(f"/accounts/login/?next=/&login={self.username}&password={self.password}")
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response.url, '/')
+
+    def test_ajax_form_response(self):
+        """Test the JSON response returned by an AJAX modal form, for invalid and valid form data"""
+        url = reverse('edit-user')
+
+        # Invalid form data (first name too long), the form is rendered again
+        response = self.client.post(url, {'first_name': 'x' * 200, 'last_name': 'User'}, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+
+        self.assertFalse(data['form_valid'])
+        self.assertIn('first_name', data['form_errors'])
+        self.assertIn('name="first_name"', data['html_form'])
+        self.assertEqual(data['title'], 'Edit User Information')
+
+        # Valid form data, the client closes the modal so the form is not rendered
+        response = self.client.post(url, {'first_name': 'Test', 'last_name': 'User'}, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+
+        self.assertTrue(data['form_valid'])
+        self.assertEqual(data['html_form'], '')
+        self.assertEqual(data['title'], 'Edit User Information')
+        self.assertEqual(data['pk'], self.user.pk)
+
+        for key in ['form_errors', 'non_field_errors']:
+            self.assertIn(key, data)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Test')
+
+    def test_set_password_response(self):
+        """Test the JSON response returned by the AJAX set-password form"""
+        url = reverse('set-password')
+
+        password = 'A-much-longer-password-123'
+
+        # Passwords do not match, the form is rendered again
+        response = self.client.post(url, {
+            'enter_password': password,
+            'confirm_password': password + 'x',
+            'old_password': self.password,
+        }, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+
+        data = response.json()
+
+        self.assertFalse(data['form_valid'])
+        self.assertIn('Password fields must match', data['html_form'])
+
+        # Valid form data, the form is not rendered
+        response = self.client.post(url, {
+            'enter_password': password,
+            'confirm_password': password,
+            'old_password': self.password,
+        }, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+
+        data = response.json()
+
+        self.assertTrue(data['form_valid'])
+        self.assertEqual(data['html_form'], '')
+        self.assertEqual(data['title'], 'Set Password')
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password(password))
@@ -4,15 +4,20 @@ In particular these views provide base functionality for rendering Django forms
 as JSON objects and passing them to modal forms (using jQuery / bootstrap).
 """
 
+import functools
+
+from django.conf import settings
 from django.contrib.auth import password_validation
 from django.contrib.auth.mixins import (LoginRequiredMixin,
                                         PermissionRequiredMixin)
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
 from django.shortcuts import redirect
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from django.urls import reverse_lazy
 from django.utils.timezone import now
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 from django.views import View
 from django.views.generic import DeleteView, DetailView, ListView, UpdateView
@@ -46,6 +51,39 @@ def auth_request(request):
     return HttpResponse(status=403)
 
 
+@functools.lru_cache(maxsize=None)
+def guess_permission_class(view_class):
+    """Guess the 'permission_class' required for a View class, based on the type of class.
+
+    The result only depends on the class hierarchy, so it is cached for each class.
+    """
+    permission_map = {
+        AjaxView: 'view',
+        ListView: 'view',
+        DetailView: 'view',
+        UpdateView: 'change',
+        DeleteView: 'delete',
+        AjaxUpdateView: 'change',
+    }
+
+    for base_class, permission in permission_map.items():
+
+        if issubclass(view_class, base_class):
+            return permission
+
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_ajax_template(template_name):
+    """Return the (compiled) template used to render an AJAX modal.
+
+    Templates are cached by name (rather than per view class),
+    as some views switch between templates (e.g. for each step of a form wizard).
+    """
+    return get_template(template_name)
+
+
 class InvenTreeRoleMixin(PermissionRequiredMixin):
     """Permission class based on user roles, not user 'permissions'.
 
@@ -172,21 +210,7 @@ class InvenTreeRoleMixin(PermissionRequiredMixin):
             return perm
 
         # Otherwise, we will need to have a go at guessing...
-        permission_map = {
-            AjaxView: 'view',
-            ListView: 'view',
-            DetailView: 'view',
-            UpdateView: 'change',
-            DeleteView: 'delete',
-            AjaxUpdateView: 'change',
-        }
-
-        for view_class in permission_map.keys():
-
-            if issubclass(type(self), view_class):
-                return permission_map[view_class]
-
-        return None
+        return guess_permission_class(type(self))
 
 
 class AjaxMixin(InvenTreeRoleMixin):
@@ -205,6 +229,10 @@ class AjaxMixin(InvenTreeRoleMixin):
 
     ajax_form_title = ''
 
+    # Optionally cache the rendered template for GET requests (timeout in seconds)
+    # Only set this for views where the rendered content does not depend on form data
+    ajax_cache_timeout = None
+
     def get_form_title(self):
         """Default implementation - return the ajax_form_title variable."""
         return self.ajax_form_title
@@ -254,19 +282,13 @@ class AjaxMixin(InvenTreeRoleMixin):
         Returns:
             JSON response object
         """
-        # a empty dict as default can be dangerous - set it here if empty
-        if not data:
+        # a empty dict as default can be dangerous - set it here if not provided
+        if data is None:
             data = {}
 
         if not request.is_ajax():
             return HttpResponseRedirect('/')
 
-        if context is None:
-            try:
-                context = self.get_context_data()
-            except AttributeError:
-                context = {}
-
         # If no 'form' argument is supplied, look at the underlying class
         if form is None:
             try:
@@ -274,6 +296,13 @@ class AjaxMixin(InvenTreeRoleMixin):
             except AttributeError:
                 pass
 
+        if context is None:
+            try:
+                # Pass the form through, so that it is not constructed a second time
+                context = self.get_context_data(form=form)
+            except AttributeError:
+                context = {}
+
         if form:
             context['form'] = form
         else:
@@ -281,19 +310,33 @@ class AjaxMixin(InvenTreeRoleMixin):
 
         data['title'] = self.get_form_title()
 
-        data['html_form'] = render_to_string(
-            self.ajax_template_name,
-            context,
-            request=request
-        )
+        def render_template():
+            # In debug mode, always look up the template so that changes are picked up
+            if settings.DEBUG:
+                template = get_template(self.ajax_template_name)
+            else:
+                template = get_ajax_template(self.ajax_template_name)
 
-        # Custom feedback`data
-        fb = self.get_data()
+            return template.render(context, request=request)
 
-        for key in fb.keys():
-            data[key] = fb[key]
+        if data.get('form_valid') is True:
+            # The client closes the modal once the form is valid, so the form is not rendered
+            data['html_form'] = ''
+        elif self.ajax_cache_timeout and request.method == 'GET':
+            # Rendered content is cached per view, object, user and language
+            obj = getattr(self, 'object', None)
 
-        return JsonResponse(data, safe=False)
+            key = f"ajax_{type(self).__name__}_{self.ajax_template_name}_{getattr(obj, 'pk', None)}_{request.user.pk}_{get_language()}"
+
+            data['html_form'] = cache.get_or_set(key, render_template, timeout=self.ajax_cache_timeout)
+        else:
+            data['html_form'] = render_template()
+
+        # Custom feedback`data
+        data.update(self.get_data())
+
+        # Use compact separators, as the rendered form HTML can be large
+        return JsonResponse(data, safe=False, json_dumps_params={'separators': (',', ':')})
 
 
 class AjaxView(AjaxMixin, View):
@@ -327,9 +370,12 @@ class AjaxUpdateView(AjaxMixin, UpdateView):
         - Populates form with object data
         - Renders form to JSON and returns to client
         """
-        super(UpdateView, self).get(request, *args, **kwargs)
+        # Only the object is required here, the form is rendered by renderJsonResponse
+        self.object = self.get_object()
 
-        return self.renderJsonResponse(request, self.get_form(), context=self.get_context_data())
+        form = self.get_form()
+
+        return self.renderJsonResponse(request, form, context=self.get_context_data(form=form))
 
     def save(self, object, form, **kwargs):
         """Method for updating the object in the database. Default implementation is very simple, but can be overridden if required.
@@ -374,10 +420,6 @@ class AjaxUpdateView(AjaxMixin, UpdateView):
             'non_field_errors': form.non_field_errors().as_json(),
         }
 
-        # Add in any extra class data
-        for value, key in enumerate(self.get_data()):
-            data[key] = value
-
         if valid:
 
             # Save the updated object to the database
@@ -591,11 +633,10 @@ class CustomLoginView(LoginView):
             # Initiate form
             form = self.get_form_class()(request.GET.dict(), request=request)
 
-            # Validate form data
+            # Validate form data (this also authenticates the user)
             form.is_valid()
 
             # Try to login
-            form.full_clean()
             return form.login(request)
 
         return super().get(request, *args, **kwargs)
@@ -648,6 +689,9 @@ class AboutView(AjaxView):
     ajax_template_name = "about.html"
     ajax_form_title = _("About InvenTree")
 
+    # Version information does not change between requests
+    ajax_cache_timeout = 60
+
 
 class NotificationsView(TemplateView):
     """View for showing notifications."""
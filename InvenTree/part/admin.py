@@ -7,6 +7,7 @@ from import_export import widgets
 from import_export.admin import ImportExportModelAdmin
 from import_export.fields import Field
 
+import part.filters
 from company.models import SupplierPart
 from InvenTree.admin import InvenTreeResource
 from part import models
@@ -196,7 +197,15 @@ class PartCategoryResource(InvenTreeResource):
     pathstring = Field(attribute='pathstring', column_name=_('Category Path'))
 
     # Calculated fields
-    parts = Field(attribute='item_count', column_name=_('Parts'), widget=widgets.IntegerWidget(), readonly=True)
+    parts = Field(attribute='part_count', column_name=_('Parts'), widget=widgets.IntegerWidget(), readonly=True)
+
+    def filter_export(self, queryset, *args, **kwargs):
+        """Annotate the exported queryset, to avoid extra database hits for each exported row"""
+        queryset = queryset.select_related('parent', 'default_location').annotate(
+            part_count=part.filters.annotate_category_parts()
+        )
+
+        return queryset
 
     def after_import(self, dataset, result, using_transactions, dry_run, **kwargs):
         """Rebuild MPTT tree structure after importing PartCategory data"""
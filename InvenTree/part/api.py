@@ -27,7 +27,7 @@ from InvenTree.helpers import (DownloadFile, increment_serial_number, isNull,
 from InvenTree.mixins import (CreateAPI, CustomRetrieveUpdateDestroyAPI,
                               ListAPI, ListCreateAPI, RetrieveAPI,
                               RetrieveUpdateAPI, RetrieveUpdateDestroyAPI,
-                              UpdateAPI)
+                              TreeListAPI, UpdateAPI)
 from InvenTree.permissions import RolePermission
 from InvenTree.status_codes import (BuildStatusGroups,
                                     PurchaseOrderStatusGroups,
@@ -59,7 +59,7 @@ class CategoryMixin:
         ctx = super().get_serializer_context()
 
         try:
-            ctx['starred_categories'] = [star.category for star in self.request.user.starred_categories.all()]
+            ctx['starred_categories'] = set(self.request.user.starred_categories.values_list('category', flat=True))
         except AttributeError:
             # Error is thrown if the view does not have an associated request
             ctx['starred_categories'] = []
@@ -146,7 +146,7 @@ class CategoryList(CategoryMixin, APIDownloadMixin, ListCreateAPI):
 
         if starred is not None:
             starred = str2bool(starred)
-            starred_categories = [star.category.pk for star in self.request.user.starred_categories.all()]
+            starred_categories = self.request.user.starred_categories.values('category')
 
             if starred:
                 queryset = queryset.filter(pk__in=starred_categories)
@@ -224,7 +224,7 @@ class CategoryDetail(CategoryMixin, CustomRetrieveUpdateDestroyAPI):
                                       delete_child_categories=delete_child_categories))
 
 
-class CategoryTree(ListAPI):
+class CategoryTree(TreeListAPI):
     """API endpoint for accessing a list of PartCategory objects ready for rendering a tree."""
 
     queryset = PartCategory.objects.all()
@@ -999,10 +999,10 @@ class PartMixin:
         # Indicate that we can create a new Part via this endpoint
         kwargs['create'] = self.is_create
 
-        # Pass a list of "starred" parts to the current user to the serializer
+        # Pass the set of "starred" part IDs for the current user to the serializer
         # We do this to reduce the number of database queries required!
         if self.starred_parts is None and self.request is not None:
-            self.starred_parts = [star.part for star in self.request.user.starred_parts.all()]
+            self.starred_parts = set(self.request.user.starred_parts.values_list('part', flat=True))
 
         kwargs['starred_parts'] = self.starred_parts
 
@@ -1065,7 +1065,7 @@ class PartList(PartMixin, APIDownloadMixin, ListCreateAPI):
         if page is not None:
             return self.get_paginated_response(data)
         elif request.is_ajax():
-            return JsonResponse(data, safe=False)
+            return JsonResponse(data, safe=False, json_dumps_params={'separators': (',', ':')})
         return Response(data)
 
     def filter_queryset(self, queryset):
@@ -1155,7 +1155,7 @@ class PartList(PartMixin, APIDownloadMixin, ListCreateAPI):
 
         if starred is not None:
             starred = str2bool(starred)
-            starred_parts = [star.part.pk for star in self.request.user.starred_parts.all()]
+            starred_parts = self.request.user.starred_parts.values('part')
 
             if starred:
                 queryset = queryset.filter(pk__in=starred_parts)
@@ -1734,7 +1734,7 @@ class BomList(BomMixin, ListCreateDestroyAPIView):
         if page is not None:
             return self.get_paginated_response(data)
         elif request.is_ajax():
-            return JsonResponse(data, safe=False)
+            return JsonResponse(data, safe=False, json_dumps_params={'separators': (',', ':')})
         return Response(data)
 
     def filter_queryset(self, queryset):
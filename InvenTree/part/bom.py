@@ -75,27 +75,28 @@ def ExportBom(part: Part, fmt='csv', cascade: bool = False, max_levels: int = No
 
     bom_items = []
 
-    uids = []
+    def get_items(items, level, parents):
+        # Return (item, level, parents) entries, reversed so that items are popped in order
+        return [(item, level, parents) for item in reversed(list(items.order_by('id')))]
 
-    def add_items(items, level, cascade=True):
-        # Add items at a given layer
-        for item in items:
+    # Traverse the BOM depth-first, using an explicit stack rather than recursion.
+    # Each entry carries the set of parent parts above it in the BOM tree
+    stack = get_items(part.get_bom_items(), 1, frozenset([part.pk]))
 
-            item.level = str(int(level))
+    while stack:
+        item, level, parents = stack.pop()
 
-            # Avoid circular BOM references
-            if item.pk in uids:
-                continue
+        # Avoid circular BOM references
+        if item.sub_part_id in parents:
+            continue
 
-            bom_items.append(item)
+        item.level = str(int(level))
 
-            if cascade and item.sub_part.assembly:
-                if max_levels is None or level < max_levels:
-                    add_items(item.sub_part.bom_items.all().order_by('id'), level + 1)
+        bom_items.append(item)
 
-    top_level_items = part.get_bom_items().order_by('id')
-
-    add_items(top_level_items, 1, cascade)
+        if cascade and item.sub_part.assembly:
+            if max_levels is None or level < max_levels:
+                stack.extend(get_items(item.sub_part.bom_items.all(), level + 1, parents | {item.sub_part_id}))
 
     dataset = BomItemResource().export(
         queryset=bom_items,
@@ -203,6 +203,34 @@ def annotate_variant_quantity(subquery: Q, reference: str = 'quantity'):
     )
 
 
+def filter_low_stock(queryset):
+    """Filter a queryset of Part objects to return only parts which are 'low on stock'.
+
+    - The total stock quantity (including variant stock) is annotated against each part
+    - Parts with a total stock quantity less than the 'minimum_stock' level are returned
+    - This performs the same check as Part.is_part_low_on_stock(), in a single database query
+
+    Arguments:
+        queryset - A queryset of Part objects
+
+    Returns:
+        A queryset of Part objects which are low on stock
+    """
+    queryset = queryset.annotate(
+        in_stock=annotate_total_stock(),
+        variant_stock=annotate_variant_quantity(variant_stock_query(), reference='quantity'),
+    )
+
+    queryset = queryset.annotate(
+        total_in_stock=ExpressionWrapper(
+            F('in_stock') + F('variant_stock'),
+            output_field=models.DecimalField(),
+        )
+    )
+
+    return queryset.filter(total_in_stock__lt=F('minimum_stock'))
+
+
 def annotate_category_parts():
     """Construct a queryset annotation which returns the number of parts in a particular category.
 
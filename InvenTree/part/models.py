@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import decimal
+import functools
 import hashlib
 import logging
 import os
@@ -299,6 +300,22 @@ def rename_part_image(instance, filename):
     return os.path.join(base, fname)
 
 
+@functools.lru_cache(maxsize=32)
+def get_part_name_template(name_format):
+    """Return a compiled template for the provided PART_NAME_FORMAT string.
+
+    Compiling the template is expensive compared to rendering it,
+    and the format string rarely changes, so compiled templates are cached.
+
+    Args:
+        name_format: Template string used to format the part name
+
+    Returns:
+        Compiled jinja2 Template object
+    """
+    return Template(name_format)
+
+
 class PartManager(TreeManager):
     """Defines a custom object manager for the Part model.
 
@@ -706,7 +723,7 @@ class Part(InvenTreeBarcodeMixin, InvenTreeNotesMixin, MetadataMixin, MPTTModel)
 
         try:
             context = {'part': self}
-            template_string = Template(full_name_pattern)
+            template_string = get_part_name_template(full_name_pattern)
             full_name = template_string.render(context)
 
             return full_name
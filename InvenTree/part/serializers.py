@@ -74,7 +74,7 @@ class CategorySerializer(InvenTree.serializers.InvenTreeModelSerializer):
 
     def get_starred(self, category):
         """Return True if the category is directly "starred" by the current user."""
-        return category in self.context.get('starred_categories', [])
+        return category.pk in self.context.get('starred_categories', [])
 
     @staticmethod
     def annotate_queryset(queryset):
@@ -685,7 +685,7 @@ class PartSerializer(InvenTree.serializers.RemoteImageMixin, InvenTree.serialize
 
     def get_starred(self, part):
         """Return "true" if the part is starred by the current user."""
-        return part in self.starred_parts
+        return part.pk in self.starred_parts
 
     # Extra detail for the category
     category_detail = CategorySerializer(source='category', many=False, read_only=True)
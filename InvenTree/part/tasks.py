@@ -16,6 +16,7 @@ import company.models
 import InvenTree.helpers
 import InvenTree.helpers_model
 import InvenTree.tasks
+import part.filters as part_filters
 import part.models
 import part.stocktake
 from InvenTree.tasks import (ScheduledTask, check_daily_holdoff,
@@ -59,12 +60,12 @@ def notify_low_stock_if_required(part: part.models.Part):
     # Run "up" the tree, to allow notification for "parent" parts
     parts = part.get_ancestors(include_self=True, ascending=True)
 
-    for p in parts:
-        if p.is_part_low_on_stock():
-            InvenTree.tasks.offload_task(
-                notify_low_stock,
-                p
-            )
+    # Perform the stock level check in the database, rather than once per part
+    for p in part_filters.filter_low_stock(parts):
+        InvenTree.tasks.offload_task(
+            notify_low_stock,
+            p
+        )
 
 
 def update_part_pricing(pricing: part.models.PartPricing, counter: int = 0):
@@ -1,16 +1,19 @@
 """Unit tests for the various part API endpoints"""
 
+import tempfile
 from decimal import Decimal
 from enum import IntEnum
 from random import randint
 
-from django.core.exceptions import ValidationError
-from django.db import connection
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db import connection, transaction
+from django.test import override_settings
 from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 import PIL
-from rest_framework import status
+from rest_framework import serializers, status
 from rest_framework.test import APIClient
 
 import build.models
@@ -21,10 +24,12 @@ from company.models import Company, SupplierPart
 from InvenTree.status_codes import (BuildStatus, PurchaseOrderStatusGroups,
                                     StockStatus)
 from InvenTree.unit_test import InvenTreeAPITestCase
+from part.api import CategoryTree as CategoryTreeView
 from part.models import (BomItem, BomItemSubstitute, Part, PartCategory,
                          PartCategoryParameterTemplate, PartParameter,
                          PartParameterTemplate, PartRelated, PartStocktake,
                          PartTestTemplate)
+from part.serializers import CategoryTree as CategoryTreeSerializer
 from stock.models import StockItem, StockLocation
 
 
@@ -107,6 +112,92 @@ class PartCategoryAPITest(InvenTreeAPITestCase):
             for f in fields:
                 self.assertIn(f, result, f'"{f}" is missing in result of PartCategory list')
 
+    def test_category_tree(self):
+        """Test the PartCategoryTree API endpoint, and invalidation of the cached tree data"""
+        url = reverse('api-part-category-tree')
+        key = PartCategory.get_tree_cache_key()
+
+        # The default (process-local) test cache is not used for the tree data
+        response = self.get(url, expected_code=200)
+        self.assertEqual(len(response.data), 8)
+        self.assertIsNone(cache.get(key))
+
+        # Use a cache backend which is shared between processes
+        with tempfile.TemporaryDirectory() as cache_dir, override_settings(CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': cache_dir,
+            }
+        }):
+            response = self.get(url, expected_code=200)
+            self.assertEqual(len(response.data), 8)
+            self.assertIsNotNone(cache.get(key))
+
+            # Renaming a category invalidates the cached data, once the transaction is committed
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    category = PartCategory.objects.get(pk=1)
+                    category.name = 'Renamed category'
+                    category.save()
+
+                self.assertIsNotNone(cache.get(key))
+
+            self.assertIsNone(cache.get(key))
+
+            response = self.get(url, expected_code=200)
+            self.assertEqual(len(response.data), 8)
+
+            for result in response.data:
+                if result['pk'] == 1:
+                    self.assertEqual(result['name'], 'Renamed category')
+
+            # Creating a new category should also invalidate the cached data
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    PartCategory.objects.create(name='New category', parent=category)
+
+            response = self.get(url, expected_code=200)
+            self.assertEqual(len(response.data), 9)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    category.delete()
+
+            response = self.get(url, expected_code=200)
+            self.assertEqual(len(response.data), 8)
+
+    def test_category_tree_fields(self):
+        """Test that the tree endpoint rejects serializer fields which cannot be read from the database"""
+        class Serializer(CategoryTreeSerializer):
+            """Serializer with an extra (computed) field."""
+
+            class Meta(CategoryTreeSerializer.Meta):
+                """Metaclass options."""
+
+                fields = CategoryTreeSerializer.Meta.fields + ['item_count']
+
+        class MethodSerializer(CategoryTreeSerializer):
+            """Serializer which overrides a database column with a method field."""
+
+            description = serializers.SerializerMethodField()
+
+            class Meta(CategoryTreeSerializer.Meta):
+                """Metaclass options."""
+
+                fields = CategoryTreeSerializer.Meta.fields + ['description']
+
+        view = CategoryTreeView()
+
+        # The default serializer fields are all database columns
+        data = list(view.get_tree_queryset(PartCategory.objects.all()))
+        self.assertEqual(len(data), PartCategory.objects.count())
+
+        for serializer_class in [Serializer, MethodSerializer]:
+            view.serializer_class = serializer_class
+
+            with self.assertRaises(ImproperlyConfigured):
+                view.get_tree_queryset(PartCategory.objects.all())
+
     def test_part_count(self):
         """Test that the 'part_count' field is annotated correctly"""
         url = reverse('api-part-category-list')
@@ -744,6 +835,25 @@ class PartAPITest(PartAPITestBase):
         response = self.get(url, {'related': 1}, expected_code=200)
         self.assertEqual(len(response.data), 2)
 
+    def test_filter_by_starred(self):
+        """Test that the 'starred' status is reported and filtered correctly"""
+        url = reverse('api-part-list')
+
+        for pk in [1, 2]:
+            Part.objects.get(pk=pk).set_starred(self.user, True)
+
+        response = self.get(url, {'starred': True}, expected_code=200)
+        self.assertEqual(len(response.data), 2)
+
+        for result in response.data:
+            self.assertTrue(result['starred'])
+
+        response = self.get(url, {'starred': False}, expected_code=200)
+        self.assertEqual(len(response.data), Part.objects.count() - 2)
+
+        for result in response.data:
+            self.assertFalse(result['starred'])
+
     def test_filter_by_convert(self):
         """Test that we can correctly filter the Part list by conversion options"""
         category = PartCategory.objects.get(pk=3)
@@ -1,6 +1,7 @@
 """Unit testing for BOM export functionality."""
 
 import csv
+import json
 
 from django.urls import reverse
 
@@ -188,3 +189,35 @@ class BomExportTest(InvenTreeTestCase):
 
         content = response.headers['Content-Disposition']
         self.assertEqual(content, 'attachment; filename="BOB | Bob | A2_BOM.json"')
+
+    def test_export_levels(self):
+        """Test that a multi-level BOM is exported in order, respecting the 'levels' parameter"""
+        def export(pk, **params):
+            """Return the (level, BOM item ID) pairs for an exported BOM"""
+            url = reverse('api-bom-download', kwargs={'pk': pk})
+            response = self.client.get(url, data={'format': 'json', 'cascade': True, **params})
+            self.assertEqual(response.status_code, 200)
+
+            return [(str(row['BOM Level']), int(row['BOM Item ID'])) for row in json.loads(response.getvalue())]
+
+        # 'Assembly' (101) contains 'Bob' (100), which has four BOM items of its own
+        expected = [('1', 6), ('2', 1), ('2', 2), ('2', 3), ('2', 4)]
+
+        self.assertEqual(export(101), expected)
+        self.assertEqual(export(101, levels=2), expected)
+        self.assertEqual(export(101, levels=1), expected[:1])
+
+        # Add a circular BOM reference, bypassing validation
+        part.models.Part.objects.filter(pk=101).update(assembly=True)
+        part.models.BomItem.objects.bulk_create([
+            part.models.BomItem(part_id=100, sub_part_id=101, quantity=1)
+        ])
+
+        item = part.models.BomItem.objects.get(part=100, sub_part=101)
+
+        # Branches which refer back to a parent part are not followed
+        self.assertEqual(export(101), expected)
+        self.assertEqual(
+            export(100),
+            [('1', 1), ('1', 2), ('1', 3), ('1', 4), ('1', item.pk)]
+        )
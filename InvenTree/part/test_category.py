@@ -1,5 +1,7 @@
 """Unit tests for the PartCategory model"""
 
+from unittest import mock
+
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
@@ -129,6 +131,65 @@ class CategoryTest(TestCase):
             cat.parent = child
             cat.save()
 
+    def test_path_string_update(self):
+        """Test that pathstrings are updated when a mid-level category is renamed or deleted"""
+        A = PartCategory.objects.create(name='A')
+        B = PartCategory.objects.create(name='B', parent=A)
+        C = PartCategory.objects.create(name='C', parent=B)
+        D = PartCategory.objects.create(name='D', parent=C)
+
+        # Sibling subtree, which should not be affected
+        X = PartCategory.objects.create(name='X', parent=A)
+        Y = PartCategory.objects.create(name='Y', parent=X)
+
+        self.assertEqual(D.pathstring, 'A/B/C/D')
+
+        # Rename a mid-level category
+        B.name = 'B2'
+        B.save()
+
+        for cat, path in [(B, 'A/B2'), (C, 'A/B2/C'), (D, 'A/B2/C/D'), (X, 'A/X'), (Y, 'A/X/Y')]:
+            cat.refresh_from_db()
+            self.assertEqual(cat.pathstring, path)
+
+        # Delete a mid-level category, keeping child categories (which are moved up a level)
+        C.delete()
+
+        D.refresh_from_db()
+        self.assertEqual(D.parent, B)
+        self.assertEqual(D.pathstring, 'A/B2/D')
+
+        # Delete the top-level category, so that the children become new top-level categories
+        A.delete()
+
+        for cat, path in [(B, 'B2'), (D, 'B2/D'), (X, 'X'), (Y, 'X/Y')]:
+            cat.refresh_from_db()
+            self.assertEqual(cat.pathstring, path)
+
+        # Rebuild the pathstrings in multiple batches
+        for idx in range(5):
+            PartCategory.objects.create(name=f'E{idx}', parent=D)
+
+        # Reload the tree bounds for B, which were changed by the new nodes
+        B.refresh_from_db()
+
+        nodes = B.get_descendants(include_self=False)
+        self.assertEqual(nodes.count(), 6)
+
+        nodes.update(pathstring='')
+
+        with mock.patch.object(PartCategory.objects, 'bulk_update', wraps=PartCategory.objects.bulk_update) as bulk_update:
+            B.update_pathstrings(nodes, chunk_size=2)
+
+        # Changes are written back two nodes at a time
+        self.assertEqual(bulk_update.call_count, 3)
+
+        for args, _kwargs in bulk_update.call_args_list:
+            self.assertEqual(len(args[0]), 2)
+
+        for cat in nodes:
+            self.assertEqual(cat.pathstring, cat.construct_pathstring())
+
     def test_url(self):
         """Test that the PartCategory URL works."""
         self.assertEqual(self.capacitors.get_absolute_url(), '/part/category/3/')
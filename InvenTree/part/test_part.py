@@ -9,6 +9,7 @@ from django.test import TestCase
 
 from allauth.account.models import EmailAddress
 
+import part.filters
 import part.settings
 from common.models import (InvenTreeSetting, InvenTreeUserSetting,
                            NotificationEntry, NotificationMessage)
@@ -249,6 +250,21 @@ class PartTest(TestCase):
             self.assertEqual(r.total_stock, 0)
             self.assertEqual(r.available_stock, 0)
 
+    def test_low_stock(self):
+        """Test the low stock queryset filter against the Part model method"""
+        self.r1.minimum_stock = 10
+        self.r1.save()
+
+        parts = Part.objects.filter(pk__in=[self.r1.pk, self.r2.pk, self.c1.pk])
+
+        low_stock = part.filters.filter_low_stock(parts)
+
+        self.assertIn(self.r1, low_stock)
+        self.assertNotIn(self.r2, low_stock)
+
+        for p in parts:
+            self.assertEqual(p.is_part_low_on_stock(), p in low_stock)
+
     def test_barcode(self):
         """Test barcode format functionality"""
         barcode = self.r1.format_barcode(brief=False)
@@ -8,6 +8,7 @@ from import_export import widgets
 from import_export.admin import ImportExportModelAdmin
 from import_export.fields import Field
 
+import stock.filters
 from build.models import Build
 from company.models import Company, SupplierPart
 from InvenTree.admin import InvenTreeResource
@@ -45,7 +46,15 @@ class LocationResource(InvenTreeResource):
     pathstring = Field(attribute='pathstring', column_name=_('Location Path'))
 
     # Calculated fields
-    items = Field(attribute='item_count', column_name=_('Stock Items'), widget=widgets.IntegerWidget(), readonly=True)
+    items = Field(attribute='items', column_name=_('Stock Items'), widget=widgets.IntegerWidget(), readonly=True)
+
+    def filter_export(self, queryset, *args, **kwargs):
+        """Annotate the exported queryset, to avoid extra database hits for each exported row"""
+        queryset = queryset.select_related('parent').annotate(
+            items=stock.filters.annotate_location_items()
+        )
+
+        return queryset
 
     def after_import(self, dataset, result, using_transactions, dry_run, **kwargs):
         """Rebuild after import to keep tree intact."""
@@ -17,6 +17,7 @@ from rest_framework.serializers import ValidationError
 
 import common.models
 import common.settings
+import stock.filters
 import stock.serializers as StockSerializers
 from build.models import Build
 from build.serializers import BuildSerializer
@@ -31,7 +32,7 @@ from InvenTree.helpers import (DownloadFile, extract_serial_numbers, isNull,
                                str2bool, str2int)
 from InvenTree.mixins import (CreateAPI, CustomRetrieveUpdateDestroyAPI,
                               ListAPI, ListCreateAPI, RetrieveAPI,
-                              RetrieveUpdateDestroyAPI)
+                              RetrieveUpdateDestroyAPI, TreeListAPI)
 from InvenTree.status_codes import StockHistoryCode, StockStatus
 from order.models import (PurchaseOrder, ReturnOrder, SalesOrder,
                           SalesOrderAllocation)
@@ -360,7 +361,7 @@ class StockLocationList(APIDownloadMixin, ListCreateAPI):
     ]
 
 
-class StockLocationTree(ListAPI):
+class StockLocationTree(TreeListAPI):
     """API endpoint for accessing a list of StockLocation objects, ready for rendering as a tree."""
 
     queryset = StockLocation.objects.all()
@@ -371,6 +372,10 @@ class StockLocationTree(ListAPI):
     # Order by tree level (top levels first) and then name
     ordering = ['level', 'name']
 
+    def annotate_tree_queryset(self, queryset):
+        """Annotate the location icon, which may be inherited from the location type."""
+        return queryset.annotate(icon=stock.filters.annotate_location_icon())
+
 
 class StockLocationTypeList(ListCreateAPI):
     """API endpoint for a list of StockLocationType objects.
@@ -1,6 +1,7 @@
 """Custom query filters for the Stock models"""
 
-from django.db.models import F, Func, IntegerField, OuterRef, Q, Subquery
+from django.db.models import (Case, CharField, F, Func, IntegerField, OuterRef,
+                              Q, Subquery, Value, When)
 from django.db.models.functions import Coalesce
 
 import stock.models
@@ -33,3 +34,19 @@ def annotate_location_items(filter: Q = None):
         0,
         output_field=IntegerField()
     )
+
+
+def annotate_location_icon():
+    """Construct a queryset annotation which returns the icon for a particular location.
+
+    - Mirrors the StockLocation.icon property in the database (keep the two in sync)
+    - The custom icon takes precedence over the icon of the location type
+    """
+    return Case(
+        When(
+            Q(custom_icon='') | Q(custom_icon=None),
+            then=Coalesce(F('location_type__icon'), Value('')),
+        ),
+        default=F('custom_icon'),
+        output_field=CharField(),
+    )
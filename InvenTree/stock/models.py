@@ -177,6 +177,9 @@ class StockLocation(InvenTreeBarcodeMixin, MetadataMixin, InvenTreeTree):
         """Get the current icon used for this location.
 
         The icon field on this model takes precedences over the possibly assigned stock location type
+
+        Note: The same logic is implemented in SQL by stock.filters.annotate_location_icon(),
+        which must be kept in sync with this property.
         """
         if self.custom_icon:
             return self.custom_icon
@@ -272,6 +275,13 @@ class StockLocation(InvenTreeBarcodeMixin, MetadataMixin, InvenTreeTree):
         return self.get_stock_items(cascade=cascade)
 
 
+@receiver(post_save, sender=StockLocationType, dispatch_uid='stock_location_type_post_save')
+@receiver(post_delete, sender=StockLocationType, dispatch_uid='stock_location_type_post_delete')
+def after_change_stock_location_type(sender, instance, **kwargs):
+    """Location icons depend on the location type, so clear the cached location tree."""
+    StockLocation.clear_tree_cache()
+
+
 def generate_batch_code():
     """Generate a default 'batch code' for a new StockItem.
 
@@ -1171,7 +1181,7 @@ class StockItem(InvenTreeBarcodeMixin, InvenTreeNotesMixin, MetadataMixin, commo
     def get_installed_items(self, cascade: bool = False) -> set[StockItem]:
         """Return all stock items which are *installed* in this one!
 
-        Note: This function is recursive, and may result in a number of database hits!
+        Note: Items are fetched one level at a time, requiring one database query per level of installed items
 
         Args:
             cascade (bool, optional): Include items which are installed in items which are installed in items. Defaults to False.
@@ -1183,24 +1193,17 @@ class StockItem(InvenTreeBarcodeMixin, InvenTreeNotesMixin, MetadataMixin, commo
 
         items = StockItem.objects.filter(belongs_to=self)
 
-        for item in items:
-
+        while True:
             # Prevent duplication or recursion
-            if item == self or item in installed:
-                continue
-
-            installed.add(item)
+            new_items = [item for item in items if item != self and item not in installed]
 
-            if cascade:
-                sub_items = item.get_installed_items(cascade=True)
+            installed.update(new_items)
 
-                for sub_item in sub_items:
-
-                    # Prevent recursion
-                    if sub_item == self or sub_item in installed:
-                        continue
+            if not cascade or len(new_items) == 0:
+                break
 
-                    installed.add(sub_item)
+            # Fetch all items installed in the newly found items with a single query
+            items = StockItem.objects.filter(belongs_to__in=new_items)
 
         return installed
 
@@ -2,11 +2,15 @@
 
 import io
 import os
+import tempfile
 from datetime import datetime, timedelta
 from enum import IntEnum
 
 import django.http
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.test import override_settings
 from django.urls import reverse
 
 import tablib
@@ -106,6 +110,31 @@ class StockLocationTest(StockAPITestCase):
             for f in fields:
                 self.assertIn(f, result, f'"{f}" is missing in result of StockLocation list')
 
+    def test_export(self):
+        """Test export of StockLocation data via the API"""
+        with self.download_file(
+            self.list_url,
+            {
+                'export': 'csv',
+            },
+            expected_fn='InvenTree_Locations.csv',
+        ) as file:
+
+            data = self.process_csv(
+                file,
+                required_cols=['Location ID', 'Location Name', 'Parent Name', 'Stock Items'],
+                required_rows=StockLocation.objects.count(),
+            )
+
+            for row in data:
+                location = StockLocation.objects.get(pk=row['Location ID'])
+
+                self.assertEqual(location.name, row['Location Name'])
+                self.assertEqual(location.item_count, int(row['Stock Items']))
+
+                if location.parent:
+                    self.assertEqual(location.parent.name, row['Parent Name'])
+
     def test_add(self):
         """Test adding StockLocation."""
         # Check that we can add a new StockLocation
@@ -314,6 +343,51 @@ class StockLocationTest(StockAPITestCase):
         res = self.get(self.list_url, {"parent": str(parent_location.pk)}, expected_code=200).json()
         self.assertEqual(res[0]["icon"], "", "Custom icon and location type icon is None, None should be returned")
 
+    def test_stock_location_tree_icon(self):
+        """Test stock location icon inheritance via the location tree endpoint, and invalidation of the cached tree data."""
+        url = reverse('api-location-tree')
+        key = StockLocation.get_tree_cache_key()
+
+        location_type = StockLocationType.objects.create(name="Box", description="This is a very cool type of box", icon="fas fa-box")
+        location = StockLocation.objects.create(name="Test location", custom_icon="fas fa-microscope", location_type=location_type)
+
+        def get_icon():
+            res = self.get(url, expected_code=200).json()
+            return next(loc['icon'] for loc in res if loc['pk'] == location.pk)
+
+        def check_invalidated(func):
+            # Run func() in a transaction, and check that the cached tree is cleared once it is committed
+            self.assertIsNotNone(cache.get(key))
+
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    func()
+
+                self.assertIsNotNone(cache.get(key))
+
+            self.assertIsNone(cache.get(key))
+
+        # Use a cache backend which is shared between processes
+        with tempfile.TemporaryDirectory() as cache_dir, override_settings(CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': cache_dir,
+            }
+        }):
+            self.assertEqual(get_icon(), "fas fa-microscope")
+
+            location.custom_icon = ""
+            check_invalidated(location.save)
+            self.assertEqual(get_icon(), "fas fa-box")
+
+            # Changing (or deleting) the location type also clears the cached location tree
+            location_type.icon = "fas fa-shapes"
+            check_invalidated(location_type.save)
+            self.assertEqual(get_icon(), "fas fa-shapes")
+
+            check_invalidated(location_type.delete)
+            self.assertEqual(get_icon(), "")
+
     def test_stock_location_list_filter(self):
         """Test stock location list filters."""
         parent_location = StockLocation.objects.create(name="Parent location")
@@ -1221,3 +1221,20 @@ class TestResultTest(StockTestBase):
         tests = item.testResultMap(include_installed=False)
         self.assertEqual(len(tests), 3)
         self.assertNotIn('somenewtest', tests)
+
+    def test_installed_items(self):
+        """Test retrieval of stock items installed (at multiple levels) inside a stock item."""
+        item = StockItem.objects.get(pk=105)
+
+        self.assertEqual(len(item.get_installed_items(cascade=True)), 0)
+
+        # Install items two levels deep
+        sub_items = [
+            StockItem.objects.create(part=item.part, quantity=1, belongs_to=item, location=None) for _ in range(2)
+        ]
+
+        sub_sub_item = StockItem.objects.create(part=item.part, quantity=1, belongs_to=sub_items[0], location=None)
+
+        self.assertEqual(item.get_installed_items(cascade=False), set(sub_items))
+        self.assertEqual(item.get_installed_items(cascade=True), set(sub_items + [sub_sub_item]))
+        self.assertEqual(sub_items[0].get_installed_items(cascade=True), {sub_sub_item})